@@ -0,0 +1,22 @@
+"""Plain-text receipts.
+
+Kept apart from app.py, which builds the Flask app when imported: receipt
+archive workers are spawned processes, and they only need to import this.
+"""
+from collections import namedtuple
+import zlib
+
+# Plain tuples, so batches pickle cheaply to worker processes
+ReceiptRow = namedtuple('ReceiptRow', 'id date customer_name items_json total')
+
+def render_receipt(o):
+    return f"FRESHBASKET PREMIUM RECEIPT\n{'='*30}\nOrder ID: #{o.id}\nDate: {o.date}\nCustomer: {o.customer_name}\nItems: {o.items_json}\nTOTAL: Rs.{o.total}\n{'='*30}\nThank you for shopping!"
+
+def render_receipts(rows):
+    # Runs in a worker process: render, checksum and deflate, leaving the archive writer only concatenation
+    entries = []
+    for r in rows:
+        data = render_receipt(r).encode()
+        # Raw deflate (negative wbits), as stored in a ZIP; one-shot compress is far cheaper than a compressobj per receipt
+        entries.append((f"receipt_{r.id}.txt", r.date, zlib.crc32(data), len(data), zlib.compress(data, 6, -15)))
+    return entries
@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # app.py sits at the repo root
+
+import app as freshbasket
+
+@pytest.fixture
+def make_app(tmp_path):
+    """Build an app on a fresh SQLite file, with init_db() applied; keyword arguments override config."""
+    def build(**config):
+        settings = {
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'freshbasket.db'}",
+            'JOBS_IN_PROCESS': False, # leave jobs in the outbox rather than starting threads
+            'SWEEP_INTERVAL': 0,
+        }
+        settings.update(config)
+        app = freshbasket.create_app(settings)
+        with app.app_context(): freshbasket.init_db()
+        return app
+    return build
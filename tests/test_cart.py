@@ -0,0 +1,39 @@
+import sys
+import threading
+
+from app import Cart, CartItem, Reservation, db
+
+def test_racing_decrements_keep_the_header_in_step(make_app):
+    # A double click or two tabs: every request sees the line, but its units can only be taken out once
+    app = make_app()
+    shopper = app.test_client()
+    for pid in (1, 1, 2): shopper.post(f'/add-to-cart/{pid}')
+    cookie = shopper.get_cookie('session').value
+    clicks = ['/cart/decrement/1'] * 4 + ['/cart/remove/2', '/cart/decrement/2']
+    start = threading.Barrier(len(clicks))
+    errors = []
+
+    def click(path):
+        client = app.test_client()
+        client.set_cookie('session', cookie)
+        start.wait()
+        try:
+            client.post(path)
+        except Exception as e:
+            errors.append(repr(e))
+
+    threads = [threading.Thread(target=click, args=(path,)) for path in clicks]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6) # switch threads between the read and the write as often as possible
+    try:
+        for t in threads: t.start()
+        for t in threads: t.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    with app.app_context():
+        header = db.session.scalars(db.select(Cart)).one()
+        assert (header.item_count, header.total) == (0, 0)
+        assert db.session.query(CartItem).count() == 0
+        assert db.session.query(Reservation).count() == 0
@@ -0,0 +1,9 @@
+from app import HOT_QUERIES, explain_hot_queries
+
+def test_hot_queries_use_indexes(make_app):
+    # The same check as `flask check-query-plans`, on a schema freshly built by init_db()
+    app = make_app()
+    with app.app_context():
+        plans, failures = explain_hot_queries()
+    assert set(plans) == set(HOT_QUERIES)
+    assert failures == [], {name: plans[name] for name in failures}
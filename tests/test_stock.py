@@ -0,0 +1,44 @@
+import threading
+
+import pytest
+
+from app import Order, OrderItem, Product, db, func, update
+
+STOCK = 50
+BUYERS = 40
+PER_CART = 3
+
+@pytest.mark.parametrize('ttl', [600, 0], ids=['with-holds', 'holds-expired'])
+def test_concurrent_checkouts_never_oversell(make_app, ttl):
+    # With ttl=0 every hold has lapsed by checkout, so only the conditional UPDATE stands between the carts and the stock
+    app = make_app(RESERVATION_TTL=ttl)
+    with app.app_context():
+        db.session.execute(update(Product).where(Product.id == 1).values(stock=STOCK))
+        db.session.commit()
+    start = threading.Barrier(BUYERS)
+    placed, errors = [], []
+
+    def buyer():
+        client = app.test_client()
+        for _ in range(PER_CART): client.post('/add-to-cart/1')
+        start.wait() # check out all at once
+        try:
+            response = client.get('/checkout')
+            if response.headers['Location'].endswith('/orders'): placed.append(1)
+        except Exception as e:
+            errors.append(repr(e))
+
+    threads = [threading.Thread(target=buyer) for _ in range(BUYERS)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+
+    assert errors == []
+    with app.app_context():
+        stock = db.session.get(Product, 1).stock
+        sold = db.session.query(func.coalesce(func.sum(OrderItem.qty), 0)).filter_by(product_id=1).scalar()
+        orders = db.session.query(func.count(Order.id)).scalar()
+    assert stock >= 0
+    assert sold <= STOCK
+    assert stock == STOCK - sold
+    assert orders == len(placed) # a refused hold leaves a smaller cart, so count orders rather than units
+    assert placed # some checkouts got through